@@ -4,7 +4,7 @@ Baesync - A simple and efficient file copying tool.
 
 from .comparator import FileComparator, FileInfo
 from .logging import Logger
-from .network import NetworkHandler, RemoteFileInfo
+from .network import RemoteFileInfo, RsyncHandler
 
 __version__ = "0.1.0"
-__all__ = ["FileComparator", "FileInfo", "Logger", "NetworkHandler", "RemoteFileInfo"]
+__all__ = ["FileComparator", "FileInfo", "Logger", "RemoteFileInfo", "RsyncHandler"]
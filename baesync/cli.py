@@ -1,17 +1,76 @@
 #!/usr/bin/env python3
 import os
+import shutil
+from functools import partial
 from pathlib import Path
+from typing import Iterable, Optional, Tuple
 
 import click
 from rich.console import Console
 
 from .comparator import FileComparator
 from .logging import Logger
-from .network import RsyncHandler
+from .network import RsyncHandler, is_remote_path
 
 console = Console()
 
 
+def _copy_file(source: Path, destination: Path,
+               preserve_permissions: bool, preserve_times: bool):
+    """Copy one file's contents, then optionally its permission bits and times."""
+    shutil.copyfile(source, destination)
+    if preserve_permissions:
+        shutil.copymode(source, destination)
+    if preserve_times:
+        stat = os.stat(source)
+        os.utime(destination, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def _copy_local(source: Path, destination: Path,
+                relative_paths: Optional[Iterable[str]] = None,
+                preserve_permissions: bool = False,
+                preserve_times: bool = False) -> Tuple[bool, str]:
+    """
+    Copy a local file or directory tree without spawning rsync.
+    shutil uses kernel-side copies (sendfile/fcopyfile) where available.
+
+    Args:
+        source: Source file or directory
+        destination: Destination path
+        relative_paths: For directories, recreate the directory tree but only copy
+            these files (relative to source); None copies the whole tree, as does
+            a destination that does not exist yet
+        preserve_permissions: Preserve permissions
+        preserve_times: Preserve modification times
+
+    Returns:
+        Tuple of (success, error_message)
+    """
+    copy_function = partial(
+        _copy_file, preserve_permissions=preserve_permissions, preserve_times=preserve_times
+    )
+    try:
+        if not source.is_dir():
+            if destination.is_dir():
+                destination = destination / source.name
+            copy_function(source, destination)
+        elif relative_paths is None or not destination.exists():
+            shutil.copytree(source, destination, copy_function=copy_function, dirs_exist_ok=True)
+        else:
+            # Mirror the directories first so empty ones are copied too, as rsync
+            # does; like the comparison scan, symlinked directories are not followed
+            for dirpath, dirnames, _ in os.walk(source):
+                dst_dir = destination / os.path.relpath(dirpath, source)
+                for name in dirnames:
+                    if not os.path.islink(os.path.join(dirpath, name)):
+                        (dst_dir / name).mkdir(exist_ok=True)
+            for rel_path in relative_paths:
+                copy_function(source / rel_path, destination / rel_path)
+        return True, ""
+    except (OSError, shutil.Error) as e:
+        return False, str(e)
+
+
 @click.command()
 @click.argument("source", type=click.Path(exists=True))
 @click.argument("destination", type=click.Path())
@@ -23,9 +82,14 @@ console = Console()
 @click.option("--preserve-owner", "-O", is_flag=True, help="Preserve file owner")
 @click.option("--preserve-group", "-g", is_flag=True, help="Preserve file group")
 @click.option("--delete", "-d", is_flag=True, help="Delete extraneous files from destination")
+@click.option("--cryptographic-hash", is_flag=True,
+              help="Compare file contents with a cryptographic hash instead of xxHash")
+@click.option("--fast-hash", is_flag=True,
+              help="Only hash the first and last MiB (plus size) of files over 64 MiB")
 def cli(source: str, destination: str, overwrite: bool, recursive: bool, log_file: str,
         preserve_permissions: bool, preserve_times: bool,
-        preserve_owner: bool, preserve_group: bool, delete: bool):
+        preserve_owner: bool, preserve_group: bool, delete: bool, cryptographic_hash: bool,
+        fast_hash: bool):
     """
     Baesync - A simple and efficient file copying tool using rsync.
 
@@ -37,50 +101,70 @@ def cli(source: str, destination: str, overwrite: bool, recursive: bool, log_fil
 
     # Initialize logger and file comparator
     logger = Logger(log_file)
-    comparator = FileComparator(logger)
-    rsync_handler = RsyncHandler(logger)
+    comparator = FileComparator(
+        logger, cryptographic_hash=cryptographic_hash, fast_hash=fast_hash
+    )
 
     console.print("[bold blue]Baesync - File Copy Tool[/bold blue]")
 
-    # Log transfer start
-    logger.log_transfer_start(src_path, dst_path)
+    # Log transfer start; click has already checked that the source exists
+    logger.log_transfer_start(src_path, dst_path, source_exists=True)
 
     try:
-        # Use rsync for file transfer
-        console.print("[bold green]Using rsync for file transfer[/bold green]")
-        
+        # Local-to-local copies skip rsync unless its delete/ownership semantics are needed
+        use_rsync = (
+            delete or preserve_owner or preserve_group
+            or is_remote_path(source) or is_remote_path(destination)
+        )
+        method = "Rsync" if use_rsync else "Local copy"
+        console.print(f"[bold green]Using {method.lower()} for file transfer[/bold green]")
+
         # Convert paths to strings for rsync
         src_str = str(src_path)
         dst_str = str(dst_path)
         
-        # For directories, check for conflicts if not overwriting
-        if src_path.is_dir() and not overwrite:
+        # For directories, check for conflicts if not overwriting; local copies
+        # also use the comparison to only transfer new or changed files
+        files_to_transfer = None
+        if src_path.is_dir() and (not overwrite or not use_rsync):
             files_to_copy, files_to_skip, conflicts = comparator.compare_directories(
                 src_path, dst_path
             )
             
-            if conflicts:
+            if conflicts and not overwrite:
                 console.print("[yellow]Conflicts detected. Use --overwrite to proceed.[/yellow]")
                 return
+
+            files_to_transfer = files_to_copy | conflicts
         
-        # Sync files using rsync
-        success, error = rsync_handler.sync_files(
-            source=src_str,
-            destination=dst_str,
-            delete=delete,
-            preserve_permissions=preserve_permissions,
-            preserve_times=preserve_times,
-            preserve_owner=preserve_owner,
-            preserve_group=preserve_group,
-            recursive=recursive or src_path.is_dir(),
-            progress=True
-        )
-        
+        if use_rsync:
+            # Sync files using rsync; the handler is only created (and the rsync
+            # library imported) when actually needed
+            rsync_handler = RsyncHandler(logger)
+            success, error = rsync_handler.sync_files(
+                source=src_str,
+                destination=dst_str,
+                delete=delete,
+                preserve_permissions=preserve_permissions,
+                preserve_times=preserve_times,
+                preserve_owner=preserve_owner,
+                preserve_group=preserve_group,
+                recursive=recursive or src_path.is_dir(),
+                progress=True
+            )
+        else:
+            success, error = _copy_local(
+                src_path, dst_path,
+                relative_paths=files_to_transfer,
+                preserve_permissions=preserve_permissions,
+                preserve_times=preserve_times
+            )
+
         if success:
-            console.print("[green]Rsync completed successfully![/green]")
+            console.print(f"[green]{method} completed successfully![/green]")
             logger.log_transfer_complete(True)
         else:
-            console.print(f"[red]Rsync failed: {error}[/red]")
+            console.print(f"[red]{method} failed: {error}[/red]")
             logger.log_transfer_complete(False, error)
 
     except Exception as e:
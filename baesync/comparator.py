@@ -1,88 +1,330 @@
 import hashlib
+import mmap
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Set, Tuple, Optional
+from stat import S_ISDIR
+from typing import Callable, Dict, Iterable, Iterator, Set, Tuple, Optional, Union
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from .logging import Logger
-from .network import RsyncHandler, RemoteFileInfo
+from .network import DATACLASS_OPTIONS, RsyncHandler, RemoteFileInfo
+
+# Read size used when hashing files; large enough that hashlib releases the GIL
+# and per-chunk Python overhead is negligible.
+CHUNK_SIZE = 1 << 20
+
+# Files larger than this are memory-mapped for hashing instead of read
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# With fast_hash, files larger than this are identified by their size plus
+# the hash of their first and last PARTIAL_HASH_BLOCK bytes
+PARTIAL_HASH_THRESHOLD = 64 * 1024 * 1024
+PARTIAL_HASH_BLOCK = 1 << 20
+
+# hashlib.file_digest was added in Python 3.11
+HAS_FILE_DIGEST = sys.version_info >= (3, 11)
+
+# posix_fadvise is unavailable on Windows and macOS
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Nanoseconds per day, for bucketing st_mtime_ns into FileInfo.modified_date
+DAY_NS = 86_400 * 10**9
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Worker threads used to hash files while comparing
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Per-thread read buffer pairs reused across files by _calculate_checksum
+_thread_local = threading.local()
+
+
+def _new_cryptographic_hasher(data=b""):
+    """
+    Create a cryptographic hasher (BLAKE3, or BLAKE2b), seeded with data.
+    BLAKE2b's digest size is set to match BLAKE3's 256-bit output.
+    """
+    if blake3 is not None:
+        return blake3.blake3(data)
+    return hashlib.blake2b(data, digest_size=32)
+
+
+def _new_fast_hasher(data=b""):
+    """
+    Create the default comparison hasher (xxh3_128), seeded with data.
+    Falls back to the cryptographic hasher when xxhash is not installed.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128(data)
+    return _new_cryptographic_hasher(data)
+
+
+def _get_read_buffers(size: int) -> Tuple[bytearray, bytearray]:
+    """Return this thread's pair of reusable read buffers of the given size."""
+    buffers = getattr(_thread_local, "buffers", None)
+    if buffers is None or len(buffers[0]) != size:
+        buffers = _thread_local.buffers = (bytearray(size), bytearray(size))
+    return buffers
+
+
+def _walk_files(
+    directory: Path, onerror: Optional[Callable[[OSError], None]] = None
+) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries for files, like os.walk without following links.
+    As with os.walk, unreadable directories are skipped and reported to onerror.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+            continue
+
+        with it:
+            try:
+                for entry in it:
+                    # The dirent type answers this without a stat() for regular entries
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif not (entry.is_symlink() and entry.is_dir()):
+                        yield entry
+            except OSError as e:
+                if onerror is not None:
+                    onerror(e)
+
+
+def _day_to_date(day: int) -> date:
+    """Convert a FileInfo.modified_date day number back to a date for display."""
+    return date.fromordinal(_EPOCH_ORDINAL + day)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FileInfo:
     """Information about a file for comparison purposes."""
     path: Path
     size: int
     name: str
     relative_path: str
-    modified_date: datetime
+    modified_date: int  # Days since the epoch (UTC), so comparisons ignore the time
     checksum: Optional[str] = None
     is_remote: bool = False
-
-    def __post_init__(self):
-        """Convert modified_date to date only for comparison."""
-        if isinstance(self.modified_date, datetime):
-            self.modified_date = self.modified_date.date()
+    partial_checksum: bool = False  # checksum covers only the head, tail and size
 
 
 class FileComparator:
     """Handles file comparison operations."""
 
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, cryptographic_hash: bool = False, fast_hash: bool = False):
         self.logger = logger
-        self.rsync_handler = RsyncHandler(logger)
+        self.cryptographic_hash = cryptographic_hash
+        self.fast_hash = fast_hash
+        self._new_hasher = _new_cryptographic_hasher if cryptographic_hash else _new_fast_hasher
+
+    @cached_property
+    def rsync_handler(self) -> RsyncHandler:
+        """Rsync handler, created on first remote path so local runs skip importing rsync."""
+        return RsyncHandler(self.logger)
 
-    def _calculate_checksum(self, file_path: Path, chunk_size: int = 8192) -> Optional[str]:
-        """Calculate SHA-256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
+    def _calculate_checksum(
+        self,
+        file_path: Path,
+        chunk_size: int = CHUNK_SIZE,
+        read_executor: Optional[ThreadPoolExecutor] = None
+    ) -> Optional[str]:
+        """
+        Calculate the content checksum of a file.
+        Uses xxh3_128 by default, or BLAKE3/BLAKE2b when cryptographic_hash is set.
+        If read_executor is given, the next chunk is read on it while the current one is hashed.
+        """
+        buf, spare = _get_read_buffers(chunk_size)
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+            # Unbuffered: we read straight into our own preallocated buffer
+            with open(file_path, "rb", buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < chunk_size:
+                    # Small file: a single read and one-shot hash, no loop
+                    n = f.readinto(buf)
+                    return self._new_hasher(memoryview(buf)[:n]).hexdigest()
+
+                # Read-ahead hint for the scan, then drop the pages afterwards so
+                # hashing doesn't evict more useful entries from the page cache
+                if HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    return self._hash_large_file(f, file_path, size, buf, spare, read_executor)
+                finally:
+                    if HAS_FADVISE:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {str(e)}")
             return None
 
-    def _get_file_info(self, file_path: Path, base_path: Path) -> Optional[FileInfo]:
-        """Get file information for comparison."""
+    def _hash_large_file(
+        self,
+        f,
+        file_path: Path,
+        size: int,
+        buf: bytearray,
+        spare: bytearray,
+        read_executor: Optional[ThreadPoolExecutor]
+    ) -> str:
+        """Hash an open file that is at least one buffer long."""
+        new_hasher = self._new_hasher
+        if blake3 is not None and new_hasher is _new_cryptographic_hasher:
+            # mmaps the file and hashes it with multi-threaded SIMD kernels
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+
+        if size > MMAP_THRESHOLD:
+            # Hash the mapping directly, avoiding a copy per chunk
+            file_hash = new_hasher()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                file_hash.update(mm)
+            return file_hash.hexdigest()
+
+        if read_executor is None:
+            if HAS_FILE_DIGEST:
+                # Read/update loop runs in C with the GIL released
+                return hashlib.file_digest(f, new_hasher).hexdigest()
+
+            file_hash = new_hasher()
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                file_hash.update(view[:n])
+            return file_hash.hexdigest()
+
+        # Double buffering: read the next chunk in the background while hashing
+        # the current one; both release the GIL, so disk and CPU work overlap
+        file_hash = new_hasher()
+        n = f.readinto(buf)
+        while n:
+            pending = read_executor.submit(f.readinto, spare)
+            try:
+                file_hash.update(memoryview(buf)[:n])
+            finally:
+                n = pending.result()
+            buf, spare = spare, buf
+        return file_hash.hexdigest()
+
+    def _calculate_partial_checksum(self, file_path: Path, size: int) -> Optional[str]:
+        """
+        Calculate a checksum over the first and last PARTIAL_HASH_BLOCK bytes and the size.
+        Only meaningful when compared against another partial checksum of a same-sized file.
+        """
+        buf = _get_read_buffers(PARTIAL_HASH_BLOCK)[0]
+        view = memoryview(buf)
+        file_hash = self._new_hasher()
         try:
-            # Check if the path is a URL or remote path
-            if str(file_path).startswith(('rsync://', 'ssh://', 'sftp://')):
-                remote_info = self.rsync_handler.get_remote_file_info(str(file_path))
-                if remote_info:
-                    return FileInfo(
-                        path=remote_info.path,
-                        size=remote_info.size,
-                        name=remote_info.name,
-                        relative_path=remote_info.relative_path,
-                        modified_date=remote_info.modified_date,
-                        checksum=remote_info.checksum,
-                        is_remote=True
-                    )
-                return None
-
-            # Local file
+            with open(file_path, "rb", buffering=0) as f:
+                n = f.readinto(buf)
+                file_hash.update(view[:n])
+                f.seek(-PARTIAL_HASH_BLOCK, os.SEEK_END)
+                n = f.readinto(buf)
+                file_hash.update(view[:n])
+            file_hash.update(size.to_bytes(8, "little"))
+            return file_hash.hexdigest()
+        except Exception as e:
+            self.logger.error(f"Error calculating checksum for {file_path}: {str(e)}")
+            return None
+
+    def _build_file_info(
+        self,
+        file_path: Union[str, Path],
+        base_path: Path,
+        entry: Optional[os.DirEntry] = None
+    ) -> Optional[FileInfo]:
+        """
+        Build file information for comparison, raising on errors.
+        When a scandir entry is given, its cached stat result and name are used.
+        """
+        # Check if the path is a URL or remote path
+        if str(file_path).startswith(('rsync://', 'ssh://', 'sftp://')):
+            remote_info = self.rsync_handler.get_remote_file_info(str(file_path))
+            if remote_info:
+                return FileInfo(
+                    path=remote_info.path,
+                    size=remote_info.size,
+                    name=remote_info.name,
+                    relative_path=remote_info.relative_path,
+                    modified_date=int(remote_info.modified_date.timestamp() * 10**9) // DAY_NS,
+                    checksum=remote_info.checksum,
+                    is_remote=True
+                )
+            return None
+
+        # Local file
+        if entry is not None:
+            # scandir paths are base_path joined with the relative path
+            stat = entry.stat()
+            name = entry.name
+            relative_path = entry.path[len(os.path.join(os.fspath(base_path), "")):]
+        else:
+            file_path = Path(file_path)
             stat = file_path.stat()
+            name = file_path.name
             relative_path = str(file_path.relative_to(base_path))
-            return FileInfo(
-                path=file_path,
-                size=stat.st_size,
-                name=file_path.name,
-                relative_path=relative_path,
-                modified_date=datetime.fromtimestamp(stat.st_mtime),
-                checksum=self._calculate_checksum(file_path)
-            )
+        return FileInfo(
+            path=Path(file_path),
+            size=stat.st_size,
+            name=name,
+            relative_path=relative_path,
+            modified_date=stat.st_mtime_ns // DAY_NS
+        )
+
+    def _get_file_info(
+        self,
+        file_path: Union[str, Path],
+        base_path: Path,
+        entry: Optional[os.DirEntry] = None
+    ) -> Optional[FileInfo]:
+        """Get file information for comparison, logging errors and returning None."""
+        try:
+            return self._build_file_info(file_path, base_path, entry)
         except Exception as e:
             self.logger.error(f"Error getting file info for {file_path}: {str(e)}")
             return None
 
-    def compare_files(self, source_info: FileInfo, dest_info: FileInfo) -> bool:
-        """
-        Compare two files based on size, date, and checksum.
-        Returns True if files are identical, False otherwise.
-        """
+    def _ensure_checksum(
+        self, file_info: FileInfo, read_executor: Optional[ThreadPoolExecutor] = None
+    ) -> Optional[str]:
+        """Calculate and cache the checksum of a local file on first use."""
+        if file_info.checksum is None and not file_info.is_remote:
+            if self.fast_hash and file_info.size > PARTIAL_HASH_THRESHOLD:
+                file_info.checksum = self._calculate_partial_checksum(
+                    file_info.path, file_info.size
+                )
+                file_info.partial_checksum = True
+            else:
+                file_info.checksum = self._calculate_checksum(
+                    file_info.path, read_executor=read_executor
+                )
+        return file_info.checksum
+
+    def _metadata_matches(self, source_info: FileInfo, dest_info: FileInfo) -> bool:
+        """Cheap size and date comparison, done before any hashing."""
         # Size comparison
         if source_info.size != dest_info.size:
             self.logger.debug(f"Size mismatch for {source_info.relative_path}")
@@ -93,32 +335,111 @@ class FileComparator:
             self.logger.debug(f"Date mismatch for {source_info.relative_path}")
             return False
 
-        # Checksum comparison (only if both files have checksums)
-        if source_info.checksum and dest_info.checksum:
-            if source_info.checksum != dest_info.checksum:
+        return True
+
+    def _checksums_match(
+        self,
+        source_info: FileInfo,
+        dest_info: FileInfo,
+        read_executor: Optional[ThreadPoolExecutor] = None
+    ) -> bool:
+        """
+        Checksum comparison (only if both files have comparable checksums).
+        Partial checksums include the file size and are only compared with each other.
+        """
+        source_checksum = self._ensure_checksum(source_info, read_executor)
+        dest_checksum = self._ensure_checksum(dest_info, read_executor)
+        if source_info.partial_checksum != dest_info.partial_checksum:
+            return True
+
+        if source_checksum and dest_checksum:
+            if source_checksum != dest_checksum:
                 self.logger.debug(f"Checksum mismatch for {source_info.relative_path}")
                 return False
 
         return True
 
+    def compare_files(self, source_info: FileInfo, dest_info: FileInfo) -> bool:
+        """
+        Compare two files based on size, date, and checksum.
+        Checksums are only calculated once the cheap size and date checks pass.
+        Returns True if files are identical, False otherwise.
+        """
+        return (
+            self._metadata_matches(source_info, dest_info)
+            and self._checksums_match(source_info, dest_info)
+        )
+
     def scan_directory(self, directory: Path) -> Dict[str, FileInfo]:
         """Scan directory and return file information dictionary."""
         file_dict = {}
+        skipped = []
+
+        def skip_directory(error: OSError):
+            """Record an unreadable directory instead of aborting the scan."""
+            skipped.append(f"{error.filename}: {str(error)}")
+
         try:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_path = Path(root) / file
-                    try:
-                        file_info = self._get_file_info(file_path, directory)
-                        if file_info:
-                            file_dict[file_info.relative_path] = file_info
-                    except Exception as e:
-                        self.logger.warning(f"Skipping file {file_path}: {str(e)}")
+            # Building a FileInfo is only a stat(); a thread pool costs more than it saves
+            for entry in _walk_files(directory, onerror=skip_directory):
+                try:
+                    file_info = self._build_file_info(entry.path, directory, entry)
+                    if file_info:
+                        file_dict[file_info.relative_path] = file_info
+                except Exception as e:
+                    skipped.append(f"{entry.path}: {str(e)}")
+
+            # One aggregated warning instead of a logger call per problem file
+            if skipped:
+                self.logger.warning(
+                    f"Skipped {len(skipped)} path(s) in {directory}:\n" + "\n".join(skipped)
+                )
         except Exception as e:
             self.logger.error(f"Error scanning directory {directory}: {str(e)}")
             raise
         return file_dict
 
+    def _lookup_file_info(self, directory: str, relative_path: str) -> Optional[FileInfo]:
+        """Stat a single file under directory; returns None if it doesn't exist as a file."""
+        file_path = os.path.join(directory, relative_path)
+        try:
+            stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if S_ISDIR(stat.st_mode):
+            return None
+        return FileInfo(
+            path=Path(file_path),
+            size=stat.st_size,
+            name=os.path.basename(file_path),
+            relative_path=relative_path,
+            modified_date=stat.st_mtime_ns // DAY_NS
+        )
+
+    def lookup_files(self, directory: Path, relative_paths: Iterable[str]) -> Dict[str, FileInfo]:
+        """
+        Get file information for the given relative paths under directory.
+        Unlike scan_directory, only the requested paths are stat'ed; missing
+        ones are left out of the returned dictionary.
+        """
+        file_dict = {}
+        skipped = []
+        directory_str = os.fspath(directory)
+        # Like scan_directory, this is one stat() per file, so it runs inline
+        for rel_path in relative_paths:
+            try:
+                file_info = self._lookup_file_info(directory_str, rel_path)
+                if file_info:
+                    file_dict[rel_path] = file_info
+            except Exception as e:
+                skipped.append(f"{os.path.join(directory_str, rel_path)}: {str(e)}")
+
+        if skipped:
+            self.logger.warning(
+                f"Skipped {len(skipped)} file(s) in {directory}:\n" + "\n".join(skipped)
+            )
+        return file_dict
+
     def compare_directories(
         self, source: Path, destination: Path
     ) -> Tuple[Set[str], Set[str], Set[str]]:
@@ -128,28 +449,55 @@ class FileComparator:
         """
         self.logger.info(f"Starting directory comparison: {source} -> {destination}")
 
+        # Only destination files that also exist in the source are looked up,
+        # so large destinations aren't scanned in full
         source_files = self.scan_directory(source)
-        dest_files = self.scan_directory(destination) if destination.exists() else {}
+        dest_files = (
+            self.lookup_files(destination, source_files.keys()) if destination.exists() else {}
+        )
 
-        files_to_copy = set()
+        # Dict views support set operations in C
+        src_keys = source_files.keys()
+        dst_keys = dest_files.keys()
+        files_to_copy = src_keys - dst_keys
         files_to_skip = set()
         conflicts = set()
 
-        # Find files to copy and conflicts
-        for rel_path, src_info in source_files.items():
-            if rel_path not in dest_files:
-                files_to_copy.add(rel_path)
+        # Size and date checks are cheap, so run them inline; only files that
+        # pass them need hashing
+        needs_checksum = []
+        for rel_path in src_keys & dst_keys:
+            if self._metadata_matches(source_files[rel_path], dest_files[rel_path]):
+                needs_checksum.append(rel_path)
             else:
-                dest_info = dest_files[rel_path]
-                if not self.compare_files(src_info, dest_info):
-                    conflicts.add(rel_path)
-                    self.logger.warning(
-                        f"File mismatch for {rel_path}: "
-                        f"source_size={src_info.size}, dest_size={dest_info.size}, "
-                        f"source_date={src_info.modified_date}, dest_date={dest_info.modified_date}"
-                    )
-                else:
+                conflicts.add(rel_path)
+
+        # Hashing releases the GIL, so compare checksums in parallel; each
+        # comparison worker gets at most one prefetch read in flight. The read
+        # pool is passed down per call so concurrent comparisons never share it
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor, \
+                ThreadPoolExecutor(max_workers=SCAN_WORKERS) as read_executor:
+            matches = executor.map(
+                lambda rel_path: self._checksums_match(
+                    source_files[rel_path], dest_files[rel_path], read_executor
+                ),
+                needs_checksum
+            )
+            for rel_path, identical in zip(needs_checksum, matches):
+                if identical:
                     files_to_skip.add(rel_path)
+                else:
+                    conflicts.add(rel_path)
+
+        for rel_path in conflicts:
+            src_info = source_files[rel_path]
+            dest_info = dest_files[rel_path]
+            self.logger.warning(
+                f"File mismatch for {rel_path}: "
+                f"source_size={src_info.size}, dest_size={dest_info.size}, "
+                f"source_date={_day_to_date(src_info.modified_date)}, "
+                f"dest_date={_day_to_date(dest_info.modified_date)}"
+            )
 
         # Log summary
         self.logger.info(f"Comparison complete:")
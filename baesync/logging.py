@@ -1,5 +1,7 @@
 import logging
+import logging.handlers
 from pathlib import Path
+from typing import Optional
 
 
 class Logger:
@@ -13,9 +15,14 @@ class Logger:
         logger = logging.getLogger("Baesync")
         logger.setLevel(logging.INFO)
 
-        # File handler
+        # File handler, buffered so bursts of records don't each hit the disk;
+        # errors and interpreter shutdown flush the buffer
         fh = logging.FileHandler(log_file)
         fh.setLevel(logging.INFO)
+        buffered_fh = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=fh
+        )
+        buffered_fh.setLevel(logging.INFO)
 
         # Console handler
         ch = logging.StreamHandler()
@@ -26,7 +33,7 @@ class Logger:
         fh.setFormatter(formatter)
         ch.setFormatter(formatter)
 
-        logger.addHandler(fh)
+        logger.addHandler(buffered_fh)
         logger.addHandler(ch)
 
         return logger
@@ -47,11 +54,24 @@ class Logger:
         """Log a debug message."""
         self.logger.debug(message)
 
-    def log_transfer_start(self, source: Path, destination: Path):
-        """Log the start of a transfer operation."""
+    def log_transfer_start(
+        self,
+        source: Path,
+        destination: Path,
+        source_exists: Optional[bool] = None,
+        destination_exists: Optional[bool] = None,
+    ):
+        """
+        Log the start of a transfer operation.
+        Existence flags the caller already knows are used instead of re-checking the paths.
+        """
+        if source_exists is None:
+            source_exists = source.exists()
+        if destination_exists is None:
+            destination_exists = destination.exists()
         self.info(f"Starting transfer from {source} to {destination}")
-        self.info(f"Source exists: {source.exists()}")
-        self.info(f"Destination exists: {destination.exists()}")
+        self.info(f"Source exists: {source_exists}")
+        self.info(f"Destination exists: {destination_exists}")
 
     def log_transfer_complete(self, success: bool, error: str = None):
         """Log the completion of a transfer operation."""
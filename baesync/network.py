@@ -5,14 +5,38 @@ from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urlparse
 
 import os
+import re
+import sys
 import json
 import logging
 import tempfile
 
 from .logging import Logger
 
+# A remote "[user@]host:path", where host is an IPv4 address or a hostname whose
+# last label starts with a letter. This keeps Windows drive letters ("C:") and
+# local names like "2024-01-01T10:00.log" from being treated as hosts.
+_REMOTE_SHELL_PATH = re.compile(
+    r"^(?:[^@/\\:]+@)?"
+    r"(?:\d{1,3}(?:\.\d{1,3}){3}|(?:[A-Za-z0-9-]+\.)*[A-Za-z][A-Za-z0-9-]+):"
+)
 
-@dataclass
+# Maximum number of URLs kept in an RsyncHandler's remote file info cache
+REMOTE_INFO_CACHE_SIZE = 4096
+
+# Drop per-instance __dict__s where dataclass supports it (Python 3.10+)
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def is_remote_path(path: str) -> bool:
+    """Check whether a path refers to a remote location rather than the local filesystem."""
+    if path.startswith(('rsync://', 'ssh://', 'sftp://')):
+        return True
+    # An existing local file or directory always wins over the host:path form
+    return bool(_REMOTE_SHELL_PATH.match(path)) and not os.path.lexists(path)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class RemoteFileInfo:
     """Information about a remote file."""
     path: Path
@@ -29,6 +53,7 @@ class RsyncHandler:
 
     def __init__(self, logger: Logger):
         self.logger = logger
+        self._remote_info_cache: Dict[str, RemoteFileInfo] = {}
         self._setup_rsync()
 
     def _setup_rsync(self):
@@ -57,7 +82,23 @@ class RsyncHandler:
             return result
 
     def get_remote_file_info(self, url: str) -> Optional[RemoteFileInfo]:
-        """Get file information for a remote file using rsync."""
+        """
+        Get file information for a remote file using rsync.
+        Successful lookups are cached per URL for the lifetime of the handler.
+        """
+        cached = self._remote_info_cache.get(url)
+        if cached is not None:
+            return cached
+
+        remote_info = self._fetch_remote_file_info(url)
+        if remote_info is not None:
+            if len(self._remote_info_cache) >= REMOTE_INFO_CACHE_SIZE:
+                self._remote_info_cache.clear()
+            self._remote_info_cache[url] = remote_info
+        return remote_info
+
+    def _fetch_remote_file_info(self, url: str) -> Optional[RemoteFileInfo]:
+        """Query rsync for a remote file's information."""
         try:
             # Parse the URL to get host and path
             parsed_url = urlparse(url)
@@ -72,21 +113,22 @@ class RsyncHandler:
             with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
                 temp_path = temp_file.name
                 
-            # Use the rsync library to list files without transferring
-            rsync_client = self.rsync()
-            rsync_client.list_files(
-                source=url,
-                destination=temp_path,
-                list_only=True,
-                verbose=True
-            )
-            
-            # Read the output
-            with open(temp_path, 'r') as f:
-                output = f.read()
+            try:
+                # Use the rsync library to list files without transferring
+                rsync_client = self.rsync()
+                rsync_client.list_files(
+                    source=url,
+                    destination=temp_path,
+                    list_only=True,
+                    verbose=True
+                )
                 
-            # Clean up the temporary file
-            os.unlink(temp_path)
+                # Read the output
+                with open(temp_path, 'r') as f:
+                    output = f.read()
+            finally:
+                # Clean up the temporary file, even if rsync failed
+                os.unlink(temp_path)
             
             # Parse the output
             file_info = self._parse_rsync_output(output)
@@ -0,0 +1,145 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from baesync.cli import _copy_local, cli
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        yield Path(tmpdirname)
+
+
+@pytest.fixture
+def sample_file(temp_dir):
+    """Create a sample file for testing."""
+    file_path = temp_dir / "test.txt"
+    file_path.write_text("Test content")
+    return file_path
+
+
+@pytest.fixture
+def sample_directory(temp_dir):
+    """Create a sample directory structure, including an empty subdirectory."""
+    dir_path = temp_dir / "test_dir"
+    dir_path.mkdir()
+    (dir_path / "file1.txt").write_text("Content 1")
+    (dir_path / "file2.txt").write_text("Content 2")
+
+    subdir = dir_path / "subdir"
+    subdir.mkdir()
+    (subdir / "file3.txt").write_text("Content 3")
+
+    (dir_path / "empty" / "nested").mkdir(parents=True)
+
+    return dir_path
+
+
+def test_copy_local_only_copies_listed_files(temp_dir, sample_directory):
+    """Test that _copy_local leaves files outside relative_paths untouched."""
+    dest_dir = temp_dir / "dest_dir"
+    dest_dir.mkdir()
+    (dest_dir / "file2.txt").write_text("Stale")
+    relative_paths = {"file1.txt", os.path.join("subdir", "file3.txt")}
+
+    success, error = _copy_local(sample_directory, dest_dir, relative_paths=relative_paths)
+
+    # Verify
+    assert success, error
+    assert (dest_dir / "file1.txt").read_text() == "Content 1"
+    assert (dest_dir / "subdir" / "file3.txt").read_text() == "Content 3"
+    assert (dest_dir / "file2.txt").read_text() == "Stale"
+
+
+def test_copy_local_recreates_directory_tree(temp_dir, sample_directory):
+    """Test that empty source directories are created in an existing destination."""
+    dest_dir = temp_dir / "dest_dir"
+    dest_dir.mkdir()
+
+    success, error = _copy_local(sample_directory, dest_dir, relative_paths=set())
+
+    # Verify
+    assert success, error
+    assert (dest_dir / "empty" / "nested").is_dir()
+    assert (dest_dir / "subdir").is_dir()
+    assert not (dest_dir / "file1.txt").exists()
+
+
+def test_copy_local_new_destination(temp_dir, sample_directory):
+    """Test that a destination that doesn't exist yet receives the whole tree."""
+    dest_dir = temp_dir / "new_dir"
+
+    success, error = _copy_local(sample_directory, dest_dir, relative_paths=set())
+
+    # Verify
+    assert success, error
+    assert (dest_dir / "file1.txt").read_text() == "Content 1"
+    assert (dest_dir / "subdir" / "file3.txt").read_text() == "Content 3"
+    assert (dest_dir / "empty" / "nested").is_dir()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_copy_local_preserve_flags(temp_dir, sample_file):
+    """Test that permissions and times are only copied when requested."""
+    os.chmod(sample_file, 0o700)
+    os.utime(sample_file, (1_000_000_000, 1_000_000_000))
+
+    plain = temp_dir / "plain.txt"
+    assert _copy_local(sample_file, plain) == (True, "")
+    assert plain.stat().st_mode & 0o777 != 0o700
+    assert plain.stat().st_mtime != 1_000_000_000
+
+    preserved = temp_dir / "preserved.txt"
+    assert _copy_local(
+        sample_file, preserved, preserve_permissions=True, preserve_times=True
+    ) == (True, "")
+    assert preserved.stat().st_mode & 0o777 == 0o700
+    assert preserved.stat().st_mtime == 1_000_000_000
+
+
+def test_copy_local_reports_bare_error(temp_dir):
+    """Test that _copy_local returns the error without a 'Local copy failed' prefix."""
+    success, error = _copy_local(temp_dir / "missing.txt", temp_dir / "dest.txt")
+
+    # Verify
+    assert not success
+    assert "missing.txt" in error
+    assert not error.startswith("Local copy failed")
+
+
+def test_cli_local_copy_empty_directories(temp_dir, sample_directory):
+    """Test that local CLI copies create empty directories, as rsync does."""
+    dest_dir = temp_dir / "dest_dir"
+    dest_dir.mkdir()
+    (dest_dir / "file1.txt").write_text("Content 1")
+
+    result = CliRunner().invoke(
+        cli, [str(sample_directory), str(dest_dir), "-l", str(temp_dir / "test.log")]
+    )
+
+    # Verify
+    assert result.exit_code == 0, result.output
+    assert "Local copy completed successfully!" in result.output
+    assert (dest_dir / "empty" / "nested").is_dir()
+    assert (dest_dir / "subdir" / "file3.txt").read_text() == "Content 3"
+
+
+def test_cli_local_copy_empty_source(temp_dir):
+    """Test that copying an empty source directory creates the destination."""
+    src_dir = temp_dir / "empty_src"
+    src_dir.mkdir()
+    dest_dir = temp_dir / "dest_dir"
+
+    result = CliRunner().invoke(
+        cli, [str(src_dir), str(dest_dir), "-l", str(temp_dir / "test.log")]
+    )
+
+    # Verify
+    assert result.exit_code == 0, result.output
+    assert "Local copy completed successfully!" in result.output
+    assert dest_dir.is_dir()
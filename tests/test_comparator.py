@@ -0,0 +1,131 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from baesync import comparator as comparator_module
+from baesync.comparator import PARTIAL_HASH_BLOCK, FileComparator
+from baesync.logging import Logger
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        yield Path(tmpdirname)
+
+
+@pytest.fixture
+def logger(temp_dir):
+    """Create a logger that writes into the temporary directory."""
+    return Logger(str(temp_dir / "test.log"))
+
+
+@pytest.fixture
+def sample_directory(temp_dir):
+    """Create a sample directory structure for testing."""
+    dir_path = temp_dir / "test_dir"
+    dir_path.mkdir()
+    (dir_path / "file1.txt").write_text("Content 1")
+    (dir_path / "file2.txt").write_text("Content 2")
+
+    subdir = dir_path / "subdir"
+    subdir.mkdir()
+    (subdir / "file3.txt").write_text("Content 3")
+
+    return dir_path
+
+
+@pytest.fixture
+def small_partial_threshold(monkeypatch):
+    """Hash files over two blocks partially, so tests don't need 64 MiB files."""
+    monkeypatch.setattr(comparator_module, "PARTIAL_HASH_THRESHOLD", 2 * PARTIAL_HASH_BLOCK)
+
+
+def _write_big_pair(temp_dir, offset):
+    """Create source/dest copies of one file that differ in the byte at offset."""
+    data = bytearray(os.urandom(4 * PARTIAL_HASH_BLOCK))
+    src_dir = temp_dir / "big_src"
+    dst_dir = temp_dir / "big_dst"
+    src_dir.mkdir()
+    dst_dir.mkdir()
+    (src_dir / "big.bin").write_bytes(data)
+    data[offset] ^= 0xFF
+    (dst_dir / "big.bin").write_bytes(data)
+    for path in (src_dir / "big.bin", dst_dir / "big.bin"):
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+    return src_dir, dst_dir
+
+
+def test_fast_hash_partial_checksum(temp_dir, logger, small_partial_threshold):
+    """Test that --fast-hash only hashes the head and tail of large files."""
+    src_dir, dst_dir = _write_big_pair(temp_dir, 2 * PARTIAL_HASH_BLOCK)
+
+    # A change in the middle is invisible to the partial checksum
+    comparator = FileComparator(logger, fast_hash=True)
+    files_to_copy, files_to_skip, conflicts = comparator.compare_directories(src_dir, dst_dir)
+    assert files_to_skip == {"big.bin"}
+    assert not conflicts
+
+    file_info = comparator.lookup_files(src_dir, ["big.bin"])["big.bin"]
+    comparator._ensure_checksum(file_info)
+    assert file_info.partial_checksum
+
+    # ...but a full checksum catches it
+    comparator = FileComparator(logger)
+    files_to_copy, files_to_skip, conflicts = comparator.compare_directories(src_dir, dst_dir)
+    assert conflicts == {"big.bin"}
+
+
+def test_fast_hash_detects_head_change(temp_dir, logger, small_partial_threshold):
+    """Test that --fast-hash still flags changes within the hashed blocks."""
+    src_dir, dst_dir = _write_big_pair(temp_dir, 10)
+
+    comparator = FileComparator(logger, fast_hash=True)
+    files_to_copy, files_to_skip, conflicts = comparator.compare_directories(src_dir, dst_dir)
+
+    # Verify
+    assert conflicts == {"big.bin"}
+    assert not files_to_skip
+
+
+def test_fast_hash_small_files_use_full_checksum(temp_dir, logger, small_partial_threshold):
+    """Test that files under the threshold are still hashed in full with --fast-hash."""
+    file_path = temp_dir / "small.bin"
+    file_path.write_bytes(os.urandom(PARTIAL_HASH_BLOCK))
+
+    comparator = FileComparator(logger, fast_hash=True)
+    file_info = comparator.lookup_files(temp_dir, ["small.bin"])["small.bin"]
+
+    # Verify
+    assert comparator._ensure_checksum(file_info) == comparator._calculate_checksum(file_path)
+    assert not file_info.partial_checksum
+
+
+def test_lookup_files(sample_directory, logger):
+    """Test that lookup_files only returns the requested regular files."""
+    comparator = FileComparator(logger)
+    nested = os.path.join("subdir", "file3.txt")
+    requested = ["file1.txt", nested, "missing.txt", "subdir"]
+
+    found = comparator.lookup_files(sample_directory, requested)
+
+    # Verify
+    assert set(found) == {"file1.txt", nested}
+    assert found["file1.txt"].size == len("Content 1")
+    assert found[nested].relative_path == nested
+
+
+def test_compare_directories_missing_destination(temp_dir, sample_directory, logger):
+    """Test that every source file is copied when the destination doesn't exist."""
+    comparator = FileComparator(logger)
+
+    files_to_copy, files_to_skip, conflicts = comparator.compare_directories(
+        sample_directory, temp_dir / "missing"
+    )
+
+    # Verify
+    assert files_to_copy == {"file1.txt", "file2.txt", os.path.join("subdir", "file3.txt")}
+    assert not files_to_skip
+    assert not conflicts
@@ -0,0 +1,34 @@
+import pytest
+
+from baesync.network import is_remote_path
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "host:/srv/backup",
+        "user@host:backup",
+        "10.0.0.5:/data",
+        "ssh://host/path",
+        "rsync://host/mod",
+    ],
+)
+def test_is_remote_path_remote(path):
+    """Test that rsync-style remote locations are detected."""
+    assert is_remote_path(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["local/dir", "/abs/path:with:colons", "C:\\data", "C:/data", "2024-01-01T10:00.log"],
+)
+def test_is_remote_path_local(path):
+    """Test that local paths, drive letters and timestamped names stay local."""
+    assert not is_remote_path(path)
+
+
+def test_is_remote_path_prefers_existing_local(tmp_path, monkeypatch):
+    """Test that an existing local path wins over the host:path form."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "host:file").write_text("local")
+    assert not is_remote_path("host:file")